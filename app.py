@@ -8,7 +8,7 @@ Runs entirely locally using Whisper.
 
 import rumps
 import threading
-import subprocess
+import queue
 from typing import Optional
 import config
 from recorder import AudioRecorder, RECORDINGS_DIR
@@ -19,6 +19,18 @@ from floating_indicator import get_indicator
 from keyboard_handler import HotkeyHandler, get_hotkey_display
 
 
+# App states and their fused UI updates: state -> (icon, status, indicator method)
+STATE_RECORDING = "recording"
+STATE_PROCESSING = "processing"
+STATE_IDLE = "idle"
+
+_STATE_TABLE = {
+    STATE_RECORDING: (config.ICON_RECORDING, "Recording...", "show_recording"),
+    STATE_PROCESSING: (config.ICON_PROCESSING, "Transcribing...", "show_processing"),
+    STATE_IDLE: (config.ICON_IDLE, "Ready", "hide"),
+}
+
+
 class VoiceDictationApp(rumps.App):
     """Menu bar application for voice dictation."""
 
@@ -56,12 +68,16 @@ class VoiceDictationApp(rumps.App):
         self.paster = get_paster()
         self.history = get_history()
         self.indicator = get_indicator()
-        self.last_audio_file: Optional[str] = None
-        self.last_duration: float = 0
 
         # State
         self.is_recording = False
 
+        # Single long-lived transcription worker; the bounded queue drops new
+        # clips rather than running overlapping transcriptions (the MLX model
+        # is not re-entrant)
+        self._tx_queue: queue.Queue = queue.Queue(maxsize=2)
+        threading.Thread(target=self._transcribe_worker, daemon=True).start()
+
         # Start keyboard listener
         self.keyboard_handler = HotkeyHandler(
             on_press=self._on_hotkey_press,
@@ -77,26 +93,26 @@ class VoiceDictationApp(rumps.App):
         current = config.get_current_hotkey()
 
         for hotkey_id, (name, description) in config.HOTKEY_PRESETS.items():
-            # Add checkmark to current selection
-            prefix = "✓ " if hotkey_id == current else "   "
+            # Precompute both title variants; _change_hotkey just assigns them
+            titles = (f"✓ {name}", f"   {name}")
             item = rumps.MenuItem(
-                f"{prefix}{name}",
+                titles[0] if hotkey_id == current else titles[1],
                 callback=lambda sender, hid=hotkey_id: self._change_hotkey(hid),
             )
             item.hotkey_id = hotkey_id
+            item.hotkey_titles = titles
             self.hotkey_menu.add(item)
 
     def _change_hotkey(self, hotkey_id: str):
         """Change the active hotkey."""
         config.set_current_hotkey(hotkey_id)
+        self.keyboard_handler.set_hotkey(hotkey_id)
 
-        # Update menu checkmarks
+        # Update menu checkmarks from the precomputed titles
         current = config.get_current_hotkey()
         for item in self.hotkey_menu.values():
             if hasattr(item, 'hotkey_id'):
-                name = config.HOTKEY_PRESETS[item.hotkey_id][0]
-                prefix = "✓ " if item.hotkey_id == current else "   "
-                item.title = f"{prefix}{name}"
+                item.title = item.hotkey_titles[0 if item.hotkey_id == current else 1]
 
         # Update hotkey display
         self.hotkey_item.title = f"Hotkey: {get_hotkey_display()}"
@@ -121,6 +137,13 @@ class VoiceDictationApp(rumps.App):
         """Update the menu bar icon."""
         self.title = icon
 
+    def _set_state(self, state: str, status: Optional[str] = None):
+        """Apply icon, status, and indicator updates for a state in one call."""
+        icon, default_status, indicator_method = _STATE_TABLE[state]
+        self.title = icon
+        self.status_item.title = f"Status: {status or default_status}"
+        getattr(self.indicator, indicator_method)()
+
     def _on_audio_chunk(self, chunk):
         """Called with each audio chunk during recording."""
         self.indicator.update_waveform(chunk)
@@ -132,11 +155,7 @@ class VoiceDictationApp(rumps.App):
 
         print("Hotkey pressed - starting recording")
         self.is_recording = True
-        self.update_icon(config.ICON_RECORDING)
-        self.update_status("Recording...")
-
-        # Show floating indicator
-        self.indicator.show_recording()
+        self._set_state(STATE_RECORDING)
 
         # Start recording with live audio callback
         self.recorder.start(on_audio_chunk=self._on_audio_chunk)
@@ -148,32 +167,38 @@ class VoiceDictationApp(rumps.App):
 
         print("Hotkey released - stopping recording")
         self.is_recording = False
-        self.update_icon(config.ICON_PROCESSING)
-        self.update_status("Transcribing...")
-
-        # Show processing state
-        self.indicator.show_processing()
+        self._set_state(STATE_PROCESSING)
 
         # Stop recording and get audio
         audio = self.recorder.stop()
 
-        # Get the saved audio file path and duration
+        # Capture this clip's file path now and carry it through the
+        # queue - an instance attribute would be overwritten by a newer
+        # recording before a queued clip gets transcribed
+        audio_file = None
         if hasattr(self.recorder, 'last_saved_file'):
-            self.last_audio_file = str(self.recorder.last_saved_file)
-        if audio is not None:
-            self.last_duration = len(audio) / config.SAMPLE_RATE
+            audio_file = str(self.recorder.last_saved_file)
 
-        # Transcribe in background to not block UI
-        threading.Thread(target=self._transcribe_and_paste, args=(audio,), daemon=True).start()
-
-    def _transcribe_and_paste(self, audio):
+        # Hand off to the transcription worker so the UI is not blocked
+        try:
+            self._tx_queue.put_nowait((audio, audio_file))
+        except queue.Full:
+            print("Transcriber busy, dropping clip")
+            self._set_state(STATE_IDLE, "Busy (clip dropped)")
+
+    def _transcribe_worker(self):
+        """Worker loop that serializes transcription of queued clips."""
+        while True:
+            audio, audio_file = self._tx_queue.get()
+            self._transcribe_and_paste(audio, audio_file)
+            self._tx_queue.task_done()
+
+    def _transcribe_and_paste(self, audio, audio_file):
         """Transcribe audio and paste result."""
         try:
-            if audio is None or len(audio) < config.SAMPLE_RATE * 0.3:  # Less than 0.3 seconds
+            if audio is None or len(audio) < config.MIN_AUDIO_SAMPLES:
                 print("Audio too short, skipping")
-                self.update_status("Ready (audio too short)")
-                self.update_icon(config.ICON_IDLE)
-                self.indicator.hide()
+                self._set_state(STATE_IDLE, "Ready (audio too short)")
                 return
 
             # Transcribe
@@ -187,37 +212,34 @@ class VoiceDictationApp(rumps.App):
                 # Save to history
                 self.history.add(
                     text=text,
-                    duration_seconds=self.last_duration,
-                    audio_file=self.last_audio_file,
+                    duration_seconds=len(audio) * config.INV_SAMPLE_RATE,
+                    audio_file=audio_file,
                 )
 
                 # Paste the text
                 self.update_status("Pasting...")
                 self.paster.paste(text)
-                self.update_status("Ready")
+                self._set_state(STATE_IDLE)
                 print(f"Pasted: {text}")
             else:
-                self.update_status("Ready (no speech detected)")
+                self._set_state(STATE_IDLE, "Ready (no speech detected)")
 
         except Exception as e:
             print(f"Transcription error: {e}")
-            self.update_status(f"Error: {str(e)[:30]}")
-            self.indicator.hide()
-
-        finally:
-            self.update_icon(config.ICON_IDLE)
+            self._set_state(STATE_IDLE, f"Error: {str(e)[:30]}")
 
     @rumps.clicked("View History")
     def view_history_clicked(self, sender):
         """Show history window in a separate process."""
-        import os
+        import subprocess
+        import sys
+        from pathlib import Path
 
-        # Launch history viewer as separate process
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        viewer_path = os.path.join(app_dir, "history_viewer.py")
-        venv_python = os.path.join(app_dir, "venv", "bin", "python")
-
-        subprocess.Popen([venv_python, viewer_path])
+        # Fresh interpreter: AppKit does not support GUI work in a forked
+        # child of a running Cocoa app. sys.executable keeps the viewer in
+        # the same (possibly venv) interpreter as the app.
+        viewer = Path(__file__).parent / "history_viewer.py"
+        subprocess.Popen([sys.executable, str(viewer)])
 
     @rumps.clicked("Load Model Now")
     def load_model_clicked(self, sender):
@@ -227,6 +249,15 @@ class VoiceDictationApp(rumps.App):
 
 def main():
     """Main entry point."""
+    import importlib
+
+    # Kick off the heaviest import in the background so its shared-library
+    # loading (which releases the GIL) overlaps with app/UI construction;
+    # the model preload thread then only waits for whatever remains
+    threading.Thread(
+        target=importlib.import_module, args=("mlx_whisper",), daemon=True
+    ).start()
+
     hotkey_display = get_hotkey_display()
 
     print("=" * 50)
@@ -1,6 +1,8 @@
 """Configuration for Voice Dictation app."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Preferences file location
@@ -21,44 +23,89 @@ HOTKEY_PRESETS = {
 DEFAULT_HOTKEY = "fn"
 
 
-def get_current_hotkey() -> str:
-    """Get the current hotkey preset ID."""
-    if PREFS_FILE.exists():
+# Parsed preferences cached against the file's mtime so repeated reads
+# (menu rebuilds, every keyboard event) don't re-open and re-parse the file
+_prefs_cache = {"mtime": 0, "data": {}}
+
+# Single worker so flushes run in call order - with one thread per call,
+# two quick hotkey changes could os.replace out of order and leave the
+# older preset on disk
+_prefs_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def _get_prefs() -> dict:
+    """Get the preferences dict, re-reading the file only when it changed."""
+    try:
+        mtime = os.stat(PREFS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return _prefs_cache["data"]
+
+    if mtime != _prefs_cache["mtime"]:
         try:
             with open(PREFS_FILE) as f:
-                prefs = json.load(f)
-                hotkey = prefs.get("hotkey", DEFAULT_HOTKEY)
-                if hotkey in HOTKEY_PRESETS:
-                    return hotkey
+                _prefs_cache["data"] = json.load(f)
         except Exception:
-            pass
+            _prefs_cache["data"] = {}
+        _prefs_cache["mtime"] = mtime
+    return _prefs_cache["data"]
+
+
+def get_current_hotkey() -> str:
+    """Get the current hotkey preset ID."""
+    hotkey = _get_prefs().get("hotkey", DEFAULT_HOTKEY)
+    if hotkey in HOTKEY_PRESETS:
+        return hotkey
     return DEFAULT_HOTKEY
 
 
+def _write_prefs_atomic(prefs: dict):
+    """Write preferences to a temp file and atomically swap it into place."""
+    tmp = PREFS_FILE.with_suffix(".json.tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(prefs, f, indent=2)
+        os.replace(tmp, PREFS_FILE)
+        _prefs_cache["mtime"] = os.stat(PREFS_FILE).st_mtime_ns
+    except Exception as e:
+        print(f"Error saving preferences: {e}")
+
+
 def set_current_hotkey(hotkey_id: str):
     """Set the current hotkey preset."""
     if hotkey_id not in HOTKEY_PRESETS:
         return
 
-    prefs = {}
-    if PREFS_FILE.exists():
-        try:
-            with open(PREFS_FILE) as f:
-                prefs = json.load(f)
-        except Exception:
-            pass
-
+    prefs = dict(_get_prefs())
     prefs["hotkey"] = hotkey_id
-    with open(PREFS_FILE, "w") as f:
-        json.dump(prefs, f, indent=2)
+
+    # Update the cache first so readers see the change immediately, then
+    # flush to disk off the UI thread (the write is atomic via os.replace)
+    _prefs_cache["data"] = prefs
+    _prefs_executor.submit(_write_prefs_atomic, prefs)
 
 
 # Audio settings
 SAMPLE_RATE = 16000  # Whisper expects 16kHz
 CHANNELS = 1
+MAX_RECORD_SECONDS = 120  # Capture buffer bound; audio past this is dropped
+INV_SAMPLE_RATE = 1.0 / SAMPLE_RATE
+MIN_AUDIO_SAMPLES = int(SAMPLE_RATE * 0.3)  # Skip recordings shorter than 0.3s
+
+# Trailing-silence trimming: chunks with RMS below the threshold count as
+# silence; everything past the last voiced chunk (plus a short tail) is
+# dropped before transcription since encoder cost scales with input length
+SILENCE_RMS_THRESHOLD = 0.01
+SILENCE_TAIL_SECONDS = 0.3
+
+# Recordings whose peak amplitude never clears this are treated as silence
+# and skipped before the model runs
+VAD_THRESHOLD = 1e-3
 
-# Transcription model for mlx-whisper
-MODEL_ID = "mlx-community/whisper-large-v3-turbo"
+# Transcription model for mlx-whisper. MODEL_QUANT picks a quantized weight
+# variant ("q4", "q8", or "" for full fp16) - quantized weights cut memory
+# bandwidth, the dominant transcription cost on Apple Silicon unified memory
+MODEL_QUANT = "q4"
+MODEL_ID = f"mlx-community/whisper-large-v3-turbo{'-' + MODEL_QUANT if MODEL_QUANT else ''}"
 
 # App settings
 APP_NAME = "Voice Dictation"
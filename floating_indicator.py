@@ -9,22 +9,24 @@ from AppKit import (
     NSColor,
     NSBezierPath,
     NSFont,
-    NSMutableParagraphStyle,
+    NSTextField,
     NSCenterTextAlignment,
     NSFloatingWindowLevel,
     NSWindowStyleMaskBorderless,
     NSBackingStoreBuffered,
     NSScreen,
     NSMakeRect,
-    NSAttributedString,
-    NSForegroundColorAttributeName,
-    NSFontAttributeName,
-    NSParagraphStyleAttributeName,
     NSEvent,
+    NSTimer,
+    NSNotificationCenter,
+    NSApplicationDidChangeScreenParametersNotification,
 )
 import threading
-import time
-from collections import deque
+
+# Lookup table for the processing-wave animation (0.5 rad steps), precomputed
+# so the animation loop does no trig
+_SIN_LUT = (0.3 + 0.2 * np.sin(np.arange(26) * 0.5)).astype(np.float32)
+_ANIM_BAR_IDX = np.arange(20)
 
 
 class WaveformView(NSView):
@@ -35,12 +37,45 @@ class WaveformView(NSView):
         if self:
             # Smooth waveform with 20 bars
             self.num_bars = 20
-            self.waveform_data = deque([0.1] * self.num_bars, maxlen=self.num_bars)
-            self.target_data = [0.1] * self.num_bars
+            self.waveform_data = np.full(self.num_bars, 0.1, dtype=np.float32)
             self.status_text = "Recording"
             self.is_processing = False
             # Animation smoothing
             self._smoothing = 0.3  # Lower = smoother
+            # Redraws are coalesced: setters mark dirty, a display timer flushes
+            self._dirty = True
+
+            # Immutable draw objects built once; drawRect_ only fills
+            bounds = self.bounds()
+            width = bounds.size.width
+            height = bounds.size.height
+            self._bg_path = NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
+                bounds, height / 2, height / 2
+            )
+            self._bg_color = NSColor.colorWithRed_green_blue_alpha_(0.1, 0.1, 0.1, 0.95)
+            self._rec_color = NSColor.colorWithRed_green_blue_alpha_(1.0, 0.5, 0.3, 1.0)
+            self._proc_color = NSColor.colorWithRed_green_blue_alpha_(0.4, 0.6, 1.0, 1.0)
+
+            # Waveform updates only dirty the bar strip, not the whole pill
+            self._bars_rect = NSMakeRect(10, 0, width - 76, height)
+
+            # Status text lives in a configured-once subview so it is only
+            # re-rendered when the state actually changes
+            label = NSTextField.alloc().initWithFrame_(
+                NSMakeRect(width - 70, (height - 14) / 2, 60, 14)
+            )
+            label.setStringValue_(self.status_text)
+            label.setBezeled_(False)
+            label.setDrawsBackground_(False)
+            label.setEditable_(False)
+            label.setSelectable_(False)
+            label.setAlignment_(NSCenterTextAlignment)
+            label.setFont_(NSFont.systemFontOfSize_weight_(11, 0.3))
+            label.setTextColor_(
+                NSColor.colorWithRed_green_blue_alpha_(0.7, 0.7, 0.7, 1.0)
+            )
+            self.addSubview_(label)
+            self._status_label = label
         return self
 
     def updateWaveform_(self, raw_data):
@@ -48,47 +83,41 @@ class WaveformView(NSView):
         if raw_data is None or len(raw_data) == 0:
             return
 
-        # Resample to num_bars points
-        chunk_size = len(raw_data) // self.num_bars
-        if chunk_size == 0:
+        # Per-bar RMS in a single vectorized pass; einsum fuses the square
+        # and sum so there is no squared temporary
+        n = (len(raw_data) // self.num_bars) * self.num_bars
+        if n == 0:
             return
-
-        new_values = []
-        for i in range(self.num_bars):
-            start = i * chunk_size
-            end = start + chunk_size
-            # RMS for smoother visualization
-            chunk = raw_data[start:end]
-            rms = np.sqrt(np.mean(chunk ** 2))
-            new_values.append(rms)
+        x = np.asarray(raw_data[:n], dtype=np.float32).reshape(self.num_bars, -1)
+        rms = np.sqrt(np.einsum('ij,ij->i', x, x) / x.shape[1])
 
         # Normalize
-        max_val = max(new_values) if max(new_values) > 0 else 1
-        new_values = [v / max_val for v in new_values]
+        max_val = rms.max()
+        new_values = rms / max_val if max_val > 0 else rms
+
+        # Skip the frame when the targets are within a perceptual delta of
+        # what is already displayed (quiet speech, steady tones)
+        if np.abs(new_values - self.waveform_data).max() < 0.01:
+            return
 
-        # Smooth transition
-        for i in range(self.num_bars):
-            current = list(self.waveform_data)[i]
-            target = new_values[i]
-            # Exponential smoothing
-            smoothed = current + self._smoothing * (target - current)
-            self.waveform_data[i] = max(0.08, min(1.0, smoothed))
+        # Exponential smoothing, fused in place
+        self.waveform_data += self._smoothing * (new_values - self.waveform_data)
+        np.clip(self.waveform_data, 0.08, 1.0, out=self.waveform_data)
 
-        self.setNeedsDisplay_(True)
+        self._dirty = True
 
     def setStatusText_(self, text):
         """Update status text."""
         self.status_text = text
-        self.setNeedsDisplay_(True)
+        self._status_label.setStringValue_(text)
 
     def setProcessing_(self, processing):
         """Set processing state."""
         self.is_processing = processing
         if processing:
             # Reset to flat bars for processing animation
-            for i in range(self.num_bars):
-                self.waveform_data[i] = 0.3
-        self.setNeedsDisplay_(True)
+            self.waveform_data.fill(0.3)
+        self._dirty = True
 
     def drawRect_(self, rect):
         """Draw the waveform and status."""
@@ -97,11 +126,8 @@ class WaveformView(NSView):
         height = bounds.size.height
 
         # Draw rounded pill background (dark)
-        bg_path = NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-            bounds, height / 2, height / 2
-        )
-        NSColor.colorWithRed_green_blue_alpha_(0.1, 0.1, 0.1, 0.95).setFill()
-        bg_path.fill()
+        self._bg_color.setFill()
+        self._bg_path.fill()
 
         # Waveform area
         waveform_width = width - 80  # Leave space for text
@@ -112,37 +138,22 @@ class WaveformView(NSView):
 
         # Color based on state
         if self.is_processing:
-            NSColor.colorWithRed_green_blue_alpha_(0.4, 0.6, 1.0, 1.0).setFill()
+            self._proc_color.setFill()
         else:
-            NSColor.colorWithRed_green_blue_alpha_(1.0, 0.5, 0.3, 1.0).setFill()
+            self._rec_color.setFill()
 
-        # Draw waveform bars (centered vertically)
+        # Append all bars to one compound path and fill in a single draw call
+        bars_path = NSBezierPath.bezierPath()
+        radius = bar_width / 2
         for i, amplitude in enumerate(self.waveform_data):
             x = start_x + i * (bar_width + bar_spacing)
             bar_height = max(4, amplitude * max_bar_height * 0.7)
             y = (height - bar_height) / 2
 
-            bar_rect = NSMakeRect(x, y, bar_width, bar_height)
-            bar_path = NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-                bar_rect, bar_width / 2, bar_width / 2
+            bars_path.appendBezierPathWithRoundedRect_xRadius_yRadius_(
+                NSMakeRect(x, y, bar_width, bar_height), radius, radius
             )
-            bar_path.fill()
-
-        # Draw status text on right side
-        paragraph_style = NSMutableParagraphStyle.alloc().init()
-        paragraph_style.setAlignment_(NSCenterTextAlignment)
-
-        attrs = {
-            NSForegroundColorAttributeName: NSColor.colorWithRed_green_blue_alpha_(0.7, 0.7, 0.7, 1.0),
-            NSFontAttributeName: NSFont.systemFontOfSize_weight_(11, 0.3),
-            NSParagraphStyleAttributeName: paragraph_style,
-        }
-
-        text = NSAttributedString.alloc().initWithString_attributes_(
-            self.status_text, attrs
-        )
-        text_rect = NSMakeRect(width - 70, (height - 14) / 2, 60, 14)
-        text.drawInRect_(text_rect)
+        bars_path.fill()
 
 
 class IndicatorController(NSObject):
@@ -154,19 +165,76 @@ class IndicatorController(NSObject):
             self.window = None
             self.waveform_view = None
             self._is_visible = False
-            self._should_animate = False
+            # Processing animation runs on a main-runloop NSTimer
+            self._anim_timer = None
+            self._anim_phase = 0
             # Window dimensions - small pill shape
             self.window_width = 180
             self.window_height = 36
+            self._flush_timer = None
+            # Latest audio chunk from the recorder thread; newer chunks simply
+            # replace older ones and the display timer drains at most one per
+            # tick, so the main thread never backs up behind the audio rate
+            self._latest_chunk = None
+            self._latest_lock = threading.Lock()
+            # Screen geometry cache, refreshed only when displays change
+            self._screens_cache = None
+            NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+                self,
+                "screensChanged:",
+                NSApplicationDidChangeScreenParametersNotification,
+                None,
+            )
         return self
 
+    def screensChanged_(self, notification):
+        """Invalidate the cached screen list when displays are re-configured."""
+        self._screens_cache = None
+
+    def submitWaveform_(self, audio_chunk):
+        """Hand the newest audio chunk to the display timer (any thread)."""
+        with self._latest_lock:
+            self._latest_chunk = audio_chunk
+
+    def _ensureFlushTimer(self):
+        """Start the display-refresh timer that flushes dirty redraws."""
+        if self._flush_timer is None:
+            self._flush_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+                1.0 / 60.0, self, "flushDisplay:", None, True
+            )
+
+    def flushDisplay_(self, timer):
+        """Consume the newest chunk and issue at most one redraw per tick."""
+        with self._latest_lock:
+            chunk = self._latest_chunk
+            self._latest_chunk = None
+
+        view = self.waveform_view
+        if view is None:
+            return
+        if chunk is not None and self._is_visible:
+            view.updateWaveform_(chunk)
+        if view._dirty:
+            view._dirty = False
+            view.setNeedsDisplayInRect_(view._bars_rect)
+
     def getActiveScreen(self):
         """Get the screen where the mouse cursor is located."""
+        if self._screens_cache is None:
+            self._screens_cache = [
+                (
+                    screen.frame().origin.x,
+                    screen.frame().origin.y,
+                    screen.frame().size.width,
+                    screen.frame().size.height,
+                    screen,
+                )
+                for screen in NSScreen.screens()
+            ]
+
         mouse_location = NSEvent.mouseLocation()
-        for screen in NSScreen.screens():
-            frame = screen.frame()
-            if (frame.origin.x <= mouse_location.x <= frame.origin.x + frame.size.width and
-                frame.origin.y <= mouse_location.y <= frame.origin.y + frame.size.height):
+        for x, y, width, height, screen in self._screens_cache:
+            if x <= mouse_location.x <= x + width and y <= mouse_location.y <= y + height:
                 return screen
         return NSScreen.mainScreen()
 
@@ -200,9 +268,11 @@ class IndicatorController(NSObject):
         self.window.setIgnoresMouseEvents_(True)
         self.window.setCollectionBehavior_(1 << 1)  # NSWindowCollectionBehaviorCanJoinAllSpaces
 
-        # Create waveform view
+        # Create waveform view; layer backing lets the window server composite
+        # repaints instead of blitting the whole window
         content_frame = NSMakeRect(0, 0, self.window_width, self.window_height)
         self.waveform_view = WaveformView.alloc().initWithFrame_(content_frame)
+        self.waveform_view.setWantsLayer_(True)
         self.window.setContentView_(self.waveform_view)
 
     def repositionWindow(self):
@@ -222,66 +292,71 @@ class IndicatorController(NSObject):
         """Show recording state."""
         self.createWindow()
         self.repositionWindow()
+        self._stopAnimTimer()
         self.waveform_view.setStatusText_("REC")
         self.waveform_view.setProcessing_(False)
         self.window.orderFront_(None)
         self._is_visible = True
-        self._should_animate = True
+        self._ensureFlushTimer()
 
     def showProcessing_(self, _):
         """Show processing state."""
         if self.window and self.waveform_view:
-            self._should_animate = False
             self.waveform_view.setStatusText_("...")
             self.waveform_view.setProcessing_(True)
-            # Start animation thread
-            thread = threading.Thread(target=self._animate_processing, daemon=True)
-            thread.start()
-
-    def _animate_processing(self):
-        """Animate processing state."""
-        phase = 0
-        while self._is_visible and not self._should_animate:
-            # Create a wave pattern for processing
-            wave_data = []
-            for i in range(20):
-                # Sine wave animation
-                val = 0.3 + 0.2 * np.sin((i + phase) * 0.5)
-                wave_data.append(val)
-
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateProcessingWave:", wave_data, False
-            )
-            phase += 1
-            time.sleep(0.05)
-
-    def updateProcessingWave_(self, wave_data):
-        """Update processing wave animation."""
-        if self.waveform_view and self._is_visible:
-            for i, val in enumerate(wave_data):
-                if i < len(self.waveform_view.waveform_data):
-                    self.waveform_view.waveform_data[i] = val
-            self.waveform_view.setNeedsDisplay_(True)
-
-    def updateWaveform_(self, data):
-        """Update waveform on main thread."""
-        if self.waveform_view and self._is_visible:
-            self.waveform_view.updateWaveform_(data)
+            self._anim_phase = 0
+            if self._anim_timer is None:
+                self._anim_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+                    0.05, self, "animateTick:", None, True
+                )
+
+    def animateTick_(self, timer):
+        """Advance the processing wave by one frame (main runloop)."""
+        view = self.waveform_view
+        if view is None:
+            return
+        self._anim_phase += 1
+        view.waveform_data[:] = _SIN_LUT[
+            (self._anim_phase + _ANIM_BAR_IDX) % len(_SIN_LUT)
+        ]
+        view._dirty = True
+
+    def _stopAnimTimer(self):
+        """Invalidate the processing animation timer if running."""
+        if self._anim_timer is not None:
+            self._anim_timer.invalidate()
+            self._anim_timer = None
 
     def hide_(self, _):
         """Hide the indicator on main thread."""
-        self._should_animate = False
         self._is_visible = False
+        self._stopAnimTimer()
+        if self._flush_timer is not None:
+            self._flush_timer.invalidate()
+            self._flush_timer = None
         if self.window:
             self.window.orderOut_(None)
 
 
+# Largest audio chunk the scratch buffers accept; sounddevice blocks are far
+# smaller, larger chunks fall back to a one-off copy
+_MAX_CHUNK_SAMPLES = 8192
+
+
 class FloatingIndicator:
     """Floating window that shows recording status and waveform."""
 
     def __init__(self):
         self.controller = IndicatorController.alloc().init()
         self._is_visible = False
+        # Two reusable chunk buffers, alternated so the display timer can
+        # read one while the audio thread fills the other - no per-callback
+        # allocation on the latency-sensitive audio thread
+        self._scratch = (
+            np.empty(_MAX_CHUNK_SAMPLES, np.float32),
+            np.empty(_MAX_CHUNK_SAMPLES, np.float32),
+        )
+        self._scratch_idx = 0
 
     def show_recording(self):
         """Show recording state with animation."""
@@ -292,19 +367,30 @@ class FloatingIndicator:
 
     def show_processing(self):
         """Show processing state."""
+        if not self._is_visible:
+            return
         self.controller.performSelectorOnMainThread_withObject_waitUntilDone_(
             "showProcessing:", None, False
         )
 
     def update_waveform(self, audio_chunk):
         """Update waveform with new audio data."""
-        if self._is_visible:
-            self.controller.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateWaveform:", audio_chunk, False
-            )
+        if not self._is_visible:
+            return
+
+        n = len(audio_chunk)
+        if n <= _MAX_CHUNK_SAMPLES:
+            buf = self._scratch[self._scratch_idx][:n]
+            np.copyto(buf, audio_chunk)
+            self._scratch_idx ^= 1
+        else:
+            buf = np.asarray(audio_chunk, dtype=np.float32)
+        self.controller.submitWaveform_(buf)
 
     def hide(self):
         """Hide the indicator."""
+        if not self._is_visible:
+            return
         self._is_visible = False
         self.controller.performSelectorOnMainThread_withObject_waitUntilDone_(
             "hide:", None, False
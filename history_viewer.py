@@ -4,7 +4,9 @@ import objc
 from Foundation import (
     NSObject,
     NSMakeRect,
+    NSAttributedString,
     NSMutableAttributedString,
+    NSNotificationCenter,
     NSRange,
     NSURL,
 )
@@ -28,6 +30,8 @@ from AppKit import (
     NSViewWidthSizable,
     NSViewHeightSizable,
     NSViewMinYMargin,
+    NSViewMinXMargin,
+    NSViewBoundsDidChangeNotification,
     NSLineBreakByWordWrapping,
     NSBezelStyleRounded,
     NSControlSizeSmall,
@@ -47,45 +51,112 @@ from AppKit import (
 )
 import threading
 import os
+import re
+import time
 from datetime import datetime
 from pathlib import Path
 from storage import get_history
 
 
-def relative_time(timestamp_str: str) -> str:
-    """Convert ISO timestamp to friendly relative time."""
+def timestamp_epoch(timestamp_str: str) -> float:
+    """Parse an ISO timestamp to epoch seconds (0.0 if malformed)."""
     try:
-        dt = datetime.fromisoformat(timestamp_str)
-        now = datetime.now()
-        diff = now - dt
-
-        seconds = diff.total_seconds()
-        if seconds < 60:
-            return "Just now"
-        elif seconds < 3600:
-            mins = int(seconds / 60)
-            return f"{mins} min{'s' if mins != 1 else ''} ago"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif seconds < 172800:
-            return "Yesterday"
-        elif seconds < 604800:
-            days = int(seconds / 86400)
-            return f"{days} days ago"
-        else:
-            return dt.strftime("%b %d, %Y")
+        return datetime.fromisoformat(timestamp_str).timestamp()
     except:
+        return 0.0
+
+
+def relative_time_from_epoch(epoch: float, now_epoch: float) -> str:
+    """Friendly relative time from precomputed epoch seconds.
+
+    Pure arithmetic for the common buckets; only the ">1 week" branch
+    needs a datetime back for strftime.
+    """
+    seconds = now_epoch - epoch
+    if seconds < 60:
+        return "Just now"
+    elif seconds < 3600:
+        mins = int(seconds / 60)
+        return f"{mins} min{'s' if mins != 1 else ''} ago"
+    elif seconds < 86400:
+        hours = int(seconds / 3600)
+        return f"{hours} hour{'s' if hours != 1 else ''} ago"
+    elif seconds < 172800:
+        return "Yesterday"
+    elif seconds < 604800:
+        days = int(seconds / 86400)
+        return f"{days} days ago"
+    else:
+        return datetime.fromtimestamp(epoch).strftime("%b %d, %Y")
+
+
+def relative_time(timestamp_str: str) -> str:
+    """Convert ISO timestamp to friendly relative time."""
+    epoch = timestamp_epoch(timestamp_str)
+    if epoch <= 0:
         return timestamp_str[:10]
+    return relative_time_from_epoch(epoch, time.time())
+
+
+# full_datetime output is invariant per timestamp, so memoize it
+_full_datetime_cache: dict = {}
 
 
 def full_datetime(timestamp_str: str) -> str:
     """Get full formatted date/time."""
-    try:
-        dt = datetime.fromisoformat(timestamp_str)
-        return dt.strftime("%A, %B %d, %Y at %I:%M %p")
-    except:
-        return timestamp_str
+    cached = _full_datetime_cache.get(timestamp_str)
+    if cached is None:
+        try:
+            dt = datetime.fromisoformat(timestamp_str)
+            cached = dt.strftime("%A, %B %d, %Y at %I:%M %p")
+        except:
+            cached = timestamp_str
+        _full_datetime_cache[timestamp_str] = cached
+    return cached
+
+
+def entry_meta(entry, now_epoch: float) -> dict:
+    """Build the per-entry metadata consumed by row binds.
+
+    Everything here is invariant under filtering, so the content view
+    computes it once per load rather than on every bind.
+    """
+    word_count = getattr(entry, "_word_count", None)
+    if word_count is None:
+        word_count = count_words(entry.text)
+    if entry.duration_seconds > 0:
+        wpm = int(word_count / (entry.duration_seconds / 60))
+    else:
+        wpm = 0
+    epoch = getattr(entry, "_ts_epoch", 0.0)
+    if epoch > 0:
+        rel_time = relative_time_from_epoch(epoch, now_epoch)
+    else:
+        rel_time = relative_time(entry.timestamp)
+    return {
+        "meta": f"{rel_time}  ·  {entry.duration_seconds:.1f}s  ·  "
+                f"{word_count} words  ·  {wpm} WPM",
+        "full_time": full_datetime(entry.timestamp),
+        # stat once here instead of once per row bind; recordings don't
+        # come and go mid-session
+        "audio_exists": bool(entry.audio_file) and os.path.exists(entry.audio_file),
+    }
+
+
+def prepare_entries(entries) -> dict:
+    """Precompute the caches loadEntries_ needs.
+
+    Pure Python work (lowercasing, timestamp parsing, meta strings, audio
+    stats) with no AppKit calls, so it is safe to run off the main thread.
+    """
+    now = time.time()
+    for e in entries:
+        e._ts_epoch = timestamp_epoch(e.timestamp)
+    return {
+        "entries": entries,
+        "lower_texts": [e.text.lower() for e in entries],
+        "meta": {id(e): entry_meta(e, now) for e in entries},
+    }
 
 
 def count_words(text: str) -> int:
@@ -116,29 +187,81 @@ def format_duration(seconds: float) -> str:
         return f"{hours}h {mins}m"
 
 
+# Fonts and colors used on every row, resolved once at import so building
+# a row is attribute reads instead of repeated ObjC accessor calls
+_FONT_META = NSFont.systemFontOfSize_(11)
+_FONT_BODY = NSFont.systemFontOfSize_(13)
+_FONT_STAT_VALUE = NSFont.systemFontOfSize_weight_(16, NSFontWeightSemibold)
+_COLOR_LABEL = NSColor.labelColor()
+_COLOR_SECONDARY = NSColor.secondaryLabelColor()
+_COLOR_YELLOW = NSColor.systemYellowColor()
+_COLOR_BLACK = NSColor.blackColor()
+
+# Base attributes applied to the full body text before highlighting
+_BASE_TEXT_ATTRS = {
+    NSFontAttributeName: _FONT_BODY,
+    NSForegroundColorAttributeName: _COLOR_LABEL,
+}
+
+# Attributes applied to each search match (yellow background, dark text)
+_HIGHLIGHT_ATTRS = {
+    NSBackgroundColorAttributeName: _COLOR_YELLOW,
+    NSForegroundColorAttributeName: _COLOR_BLACK,
+}
+
+# Attributes for the meta line drawn directly in EntryView.drawRect_
+_META_DRAW_ATTRS = {
+    NSFontAttributeName: _FONT_META,
+    NSForegroundColorAttributeName: _COLOR_SECONDARY,
+}
+
+# Compiled pattern for the current search query; every visible row
+# highlights against the same query, so one slot is enough
+_pattern_cache = {"query": None, "pattern": None}
+
+
+def _search_pattern(query: str):
+    """Get a case-insensitive pattern for the query, compiled once."""
+    if _pattern_cache["query"] != query:
+        _pattern_cache["query"] = query
+        _pattern_cache["pattern"] = re.compile(re.escape(query), re.IGNORECASE)
+    return _pattern_cache["pattern"]
+
+
+# Configured SF Symbols keyed by (name, size, weight); NSImages are
+# immutable here and setImage_ retains, so instances are safe to share
+_symbol_cache: dict = {}
+
+# Map weight strings to NSFontWeight values
+_SYMBOL_WEIGHTS = {
+    "ultralight": -0.8,
+    "thin": -0.6,
+    "light": -0.4,
+    "regular": 0.0,
+    "medium": 0.23,
+    "semibold": 0.3,
+    "bold": 0.4,
+    "heavy": 0.56,
+    "black": 0.62,
+}
+
+
 def get_sf_symbol(name: str, size: float = 13, weight: str = "regular") -> NSImage:
-    """Get an SF Symbol image."""
-    # Map weight strings to NSFontWeight values
-    weights = {
-        "ultralight": -0.8,
-        "thin": -0.6,
-        "light": -0.4,
-        "regular": 0.0,
-        "medium": 0.23,
-        "semibold": 0.3,
-        "bold": 0.4,
-        "heavy": 0.56,
-        "black": 0.62,
-    }
+    """Get an SF Symbol image (cached across calls)."""
+    key = (name, size, weight)
+    if key in _symbol_cache:
+        return _symbol_cache[key]
 
     image = NSImage.imageWithSystemSymbolName_accessibilityDescription_(name, None)
     if image:
         # Configure the symbol
         config = NSImageSymbolConfiguration.configurationWithPointSize_weight_(
-            size, weights.get(weight, 0.0)
+            size, _SYMBOL_WEIGHTS.get(weight, 0.0)
         )
-        return image.imageWithSymbolConfiguration_(config)
-    return None
+        image = image.imageWithSymbolConfiguration_(config)
+
+    _symbol_cache[key] = image
+    return image
 
 
 class StatsView(NSView):
@@ -152,10 +275,16 @@ class StatsView(NSView):
 
     def _setup_stats(self, entries):
         """Set up stats display."""
-        # Calculate stats
+        # Calculate stats in a single pass; the per-entry word counts are
+        # kept on the entries so row binds don't re-split the text
         total_recordings = len(entries)
-        total_words = sum(count_words(e.text) for e in entries)
-        total_duration = sum(e.duration_seconds for e in entries)
+        total_words = 0
+        total_duration = 0.0
+        for e in entries:
+            words = count_words(e.text)
+            e._word_count = words
+            total_words += words
+            total_duration += e.duration_seconds
         avg_wpm = int(total_words / (total_duration / 60)) if total_duration > 0 else 0
 
         width = self.bounds().size.width
@@ -182,7 +311,7 @@ class StatsView(NSView):
             icon_view.setImage_(icon_image)
             icon_view.setBordered_(False)
             icon_view.setEnabled_(False)
-            icon_view.setContentTintColor_(NSColor.secondaryLabelColor())
+            icon_view.setContentTintColor_(_COLOR_SECONDARY)
             self.addSubview_(icon_view)
 
         # Value (large)
@@ -192,8 +321,8 @@ class StatsView(NSView):
         value_label.setDrawsBackground_(False)
         value_label.setEditable_(False)
         value_label.setSelectable_(False)
-        value_label.setFont_(NSFont.systemFontOfSize_weight_(16, NSFontWeightSemibold))
-        value_label.setTextColor_(NSColor.labelColor())
+        value_label.setFont_(_FONT_STAT_VALUE)
+        value_label.setTextColor_(_COLOR_LABEL)
         self.addSubview_(value_label)
 
         # Label (small)
@@ -203,8 +332,8 @@ class StatsView(NSView):
         label_field.setDrawsBackground_(False)
         label_field.setEditable_(False)
         label_field.setSelectable_(False)
-        label_field.setFont_(NSFont.systemFontOfSize_(11))
-        label_field.setTextColor_(NSColor.secondaryLabelColor())
+        label_field.setFont_(_FONT_META)
+        label_field.setTextColor_(_COLOR_SECONDARY)
         self.addSubview_(label_field)
 
     def drawRect_(self, rect):
@@ -215,68 +344,95 @@ class StatsView(NSView):
         bg_path.fill()
 
 
-class EntryView(NSView):
-    """A single history entry view."""
+# Row geometry for the entry list (shared by layout and scrolling math)
+ENTRY_HEIGHT = 100
+ENTRY_SPACING = 12
+ENTRY_PADDING = 8
 
-    def initWithEntry_width_searchQuery_(self, entry, width, search_query=""):
-        frame = NSMakeRect(0, 0, width, 100)
-        self = objc.super(EntryView, self).initWithFrame_(frame)
+
+class AudioController(NSObject):
+    """Owns the one NSSound shared by every history row.
+
+    At most one recording plays at a time, so rows forward play requests
+    here instead of each allocating a sound and polling it. The delegate
+    callback restores the originating button when playback ends.
+    """
+
+    def init(self):
+        self = objc.super(AudioController, self).init()
         if self:
-            self.entry = entry
-            self.search_query = search_query
             self.sound = None
-            self._setup_ui(width)
+            self.button = None
         return self
 
-    def _setup_ui(self, width):
-        """Set up the entry UI."""
-        # Calculate stats
-        word_count = count_words(self.entry.text)
-        wpm = calculate_wpm(self.entry.text, self.entry.duration_seconds)
-        rel_time = relative_time(self.entry.timestamp)
-        duration = f"{self.entry.duration_seconds:.1f}s"
-        full_time = full_datetime(self.entry.timestamp)
-
-        # Top row: relative time, duration, word count, WPM
-        meta_text = f"{rel_time}  ·  {duration}  ·  {word_count} words  ·  {wpm} WPM"
-        meta_label = NSTextField.alloc().initWithFrame_(NSMakeRect(16, 70, width - 100, 20))
-        meta_label.setStringValue_(meta_text)
-        meta_label.setBezeled_(False)
-        meta_label.setDrawsBackground_(False)
-        meta_label.setEditable_(False)
-        meta_label.setSelectable_(False)
-        meta_label.setFont_(NSFont.systemFontOfSize_(11))
-        meta_label.setTextColor_(NSColor.secondaryLabelColor())
-        meta_label.setToolTip_(full_time)  # Show full date on hover
-        self.addSubview_(meta_label)
-
-        # Buttons on the right
-        button_x = width - 36
-        button_y = 66
-
-        # Play button (if audio file exists)
-        if self.entry.audio_file and os.path.exists(self.entry.audio_file):
+    def playURL_forButton_(self, url, button):
+        """Start playback for a row, stopping whatever was playing."""
+        if self.sound and self.sound.isPlaying():
+            playing_button = self.button
+            self.sound.stop()  # delegate resets playing_button's icon
+            if playing_button is button:
+                return  # same row clicked again - treat as stop
+
+        self.sound = NSSound.alloc().initWithContentsOfURL_byReference_(url, True)
+        if self.sound:
+            self.sound.setDelegate_(self)
+            self.button = button
+            pause_icon = get_sf_symbol("pause.fill", size=12, weight="medium")
+            if pause_icon:
+                button.setImage_(pause_icon)
+            self.sound.play()
+
+    def sound_didFinishPlaying_(self, sound, finished):
+        """NSSound delegate - playback ended or was stopped."""
+        if self.button is not None:
             play_icon = get_sf_symbol("play.fill", size=12, weight="medium")
-            play_btn = NSButton.alloc().initWithFrame_(NSMakeRect(button_x, button_y, 28, 28))
             if play_icon:
-                play_btn.setImage_(play_icon)
-            play_btn.setBordered_(False)
-            play_btn.setToolTip_("Play recording")
-            play_btn.setTarget_(self)
-            play_btn.setAction_(objc.selector(self.playAudio_, signature=b'v@:@'))
-            self.addSubview_(play_btn)
-            self.play_btn = play_btn
-            button_x -= 32
+                self.button.setImage_(play_icon)
+            self.button = None
+
+
+class EntryView(NSView):
+    """A single history entry row.
+
+    Rows are pooled: the content view builds only enough of them to cover
+    the visible rect and rebinds them to different entries as the user
+    scrolls, so the subview hierarchy is built once per row slot rather
+    than once per entry.
+    """
+
+    def initWithWidth_(self, width):
+        frame = NSMakeRect(0, 0, width, ENTRY_HEIGHT)
+        self = objc.super(EntryView, self).initWithFrame_(frame)
+        if self:
+            self.entry = None
+            self.search_query = ""
+            self._build_ui(width)
+        return self
+
+    def _build_ui(self, width):
+        """Create the row's subviews once; configure... fills them in."""
+        # The meta line (relative time, duration, words, WPM) is drawn in
+        # drawRect_ - a full NSTextField per row just for static text is
+        # the heaviest object in the hierarchy
+        self._meta_attr = None
+
+        # Play button (hidden when the entry has no audio file)
+        play_btn = NSButton.alloc().initWithFrame_(NSMakeRect(width - 68, 66, 28, 28))
+        play_btn.setBordered_(False)
+        play_btn.setToolTip_("Play recording")
+        play_btn.setTarget_(self)
+        play_btn.setAction_(objc.selector(self.playAudio_, signature=b'v@:@'))
+        play_btn.setAutoresizingMask_(NSViewMinXMargin)
+        self.addSubview_(play_btn)
+        self.play_btn = play_btn
 
         # Copy button with SF Symbol
-        copy_icon = get_sf_symbol("doc.on.doc", size=12, weight="medium")
-        copy_btn = NSButton.alloc().initWithFrame_(NSMakeRect(button_x, button_y, 28, 28))
-        if copy_icon:
-            copy_btn.setImage_(copy_icon)
+        copy_btn = NSButton.alloc().initWithFrame_(NSMakeRect(width - 36, 66, 28, 28))
         copy_btn.setBordered_(False)
         copy_btn.setToolTip_("Copy to clipboard")
         copy_btn.setTarget_(self)
         copy_btn.setAction_(objc.selector(self.copyText_, signature=b'v@:@'))
+        copy_btn.setAutoresizingMask_(NSViewMinXMargin)
         self.addSubview_(copy_btn)
         self.copy_btn = copy_btn
 
@@ -286,62 +442,63 @@ class EntryView(NSView):
         text_label.setDrawsBackground_(False)
         text_label.setEditable_(False)
         text_label.setSelectable_(True)
-        text_label.setFont_(NSFont.systemFontOfSize_(13))
-        text_label.setTextColor_(NSColor.labelColor())
+        text_label.setFont_(_FONT_BODY)
+        text_label.setTextColor_(_COLOR_LABEL)
         text_label.setLineBreakMode_(NSLineBreakByWordWrapping)
         text_label.setMaximumNumberOfLines_(2)
+        text_label.setAutoresizingMask_(NSViewWidthSizable)
+        self.addSubview_(text_label)
+        self.text_label = text_label
+
+    def configureWithEntry_searchQuery_meta_(self, entry, search_query, meta):
+        """Bind this row to an entry (called as rows scroll into view)."""
+        self.entry = entry
+        self.search_query = search_query
+
+        if meta is None:
+            meta = entry_meta(entry, time.time())
+        self._meta_attr = NSAttributedString.alloc().initWithString_attributes_(
+            meta["meta"], _META_DRAW_ATTRS
+        )
+        self.setToolTip_(meta["full_time"])  # Full date on hover
+        self.setNeedsDisplay_(True)
+
+        has_audio = meta["audio_exists"]
+        self.play_btn.setHidden_(not has_audio)
+        if has_audio:
+            play_icon = get_sf_symbol("play.fill", size=12, weight="medium")
+            if play_icon:
+                self.play_btn.setImage_(play_icon)
+
+        copy_icon = get_sf_symbol("doc.on.doc", size=12, weight="medium")
+        if copy_icon:
+            self.copy_btn.setImage_(copy_icon)
+            self.copy_btn.setContentTintColor_(None)
 
         # Apply search highlighting if query exists
-        if self.search_query:
-            attributed = self._highlight_text(self.entry.text, self.search_query)
-            text_label.setAttributedStringValue_(attributed)
+        if search_query:
+            attributed = self._highlight_text(entry.text, search_query)
+            self.text_label.setAttributedStringValue_(attributed)
         else:
-            text_label.setStringValue_(self.entry.text)
-
-        self.addSubview_(text_label)
+            self.text_label.setStringValue_(entry.text)
 
     def _highlight_text(self, text, query):
         """Create attributed string with highlighted search matches."""
         attributed = NSMutableAttributedString.alloc().initWithString_(text)
 
-        # Set base attributes
-        full_range = NSRange(0, len(text))
-        attributed.addAttribute_value_range_(
-            NSFontAttributeName,
-            NSFont.systemFontOfSize_(13),
-            full_range
-        )
-        attributed.addAttribute_value_range_(
-            NSForegroundColorAttributeName,
-            NSColor.labelColor(),
-            full_range
-        )
+        # Batch all attribute runs inside beginEditing/endEditing so AppKit
+        # defers attribute fixing to a single pass at the end
+        attributed.beginEditing()
+        attributed.setAttributes_range_(_BASE_TEXT_ATTRS, NSRange(0, len(text)))
 
-        # Highlight matches (case-insensitive)
-        query_lower = query.lower()
-        text_lower = text.lower()
-        start = 0
-
-        while True:
-            pos = text_lower.find(query_lower, start)
-            if pos == -1:
-                break
-
-            match_range = NSRange(pos, len(query))
-            # Yellow highlight background
-            attributed.addAttribute_value_range_(
-                NSBackgroundColorAttributeName,
-                NSColor.systemYellowColor(),
-                match_range
-            )
-            # Dark text for contrast
-            attributed.addAttribute_value_range_(
-                NSForegroundColorAttributeName,
-                NSColor.blackColor(),
-                match_range
+        # Highlight matches (case-insensitive) - scanning happens inside
+        # the C regex engine, no lowered copy of the text needed
+        for m in _search_pattern(query).finditer(text):
+            attributed.addAttributes_range_(
+                _HIGHLIGHT_ATTRS, NSRange(m.start(), m.end() - m.start())
             )
-            start = pos + len(query)
 
+        attributed.endEditing()
         return attributed
 
     def copyText_(self, sender):
@@ -350,60 +507,39 @@ class EntryView(NSView):
         pasteboard.clearContents()
         pasteboard.setString_forType_(self.entry.text, NSPasteboardTypeString)
 
-        # Visual feedback - show checkmark
+        # Visual feedback - show checkmark, restore after a second via the
+        # runloop (no thread, and the UI mutation stays on the main thread)
         check_icon = get_sf_symbol("checkmark", size=12, weight="bold")
         if check_icon:
             sender.setImage_(check_icon)
             sender.setContentTintColor_(NSColor.systemGreenColor())
+        self.performSelector_withObject_afterDelay_("resetCopyIcon:", None, 1.0)
 
-        def reset():
-            import time
-            time.sleep(1.0)
-            copy_icon = get_sf_symbol("doc.on.doc", size=12, weight="medium")
-            if copy_icon:
-                sender.setImage_(copy_icon)
-                sender.setContentTintColor_(None)
-        threading.Thread(target=reset, daemon=True).start()
+    def resetCopyIcon_(self, _):
+        """Restore the copy button icon after the feedback flash."""
+        copy_icon = get_sf_symbol("doc.on.doc", size=12, weight="medium")
+        if copy_icon:
+            self.copy_btn.setImage_(copy_icon)
+            self.copy_btn.setContentTintColor_(None)
 
     def playAudio_(self, sender):
-        """Play the audio file."""
+        """Play the audio file via the shared audio controller."""
         if not self.entry.audio_file or not os.path.exists(self.entry.audio_file):
             return
 
-        # Stop any currently playing sound
-        if self.sound and self.sound.isPlaying():
-            self.sound.stop()
-            play_icon = get_sf_symbol("play.fill", size=12, weight="medium")
-            if play_icon:
-                sender.setImage_(play_icon)
-            return
-
-        # Play the audio
         url = NSURL.fileURLWithPath_(self.entry.audio_file)
-        self.sound = NSSound.alloc().initWithContentsOfURL_byReference_(url, True)
-        if self.sound:
-            pause_icon = get_sf_symbol("pause.fill", size=12, weight="medium")
-            if pause_icon:
-                sender.setImage_(pause_icon)
-            self.sound.play()
-
-            # Reset button when done
-            def check_done():
-                import time
-                while self.sound and self.sound.isPlaying():
-                    time.sleep(0.2)
-                play_icon = get_sf_symbol("play.fill", size=12, weight="medium")
-                if play_icon:
-                    sender.setImage_(play_icon)
-            threading.Thread(target=check_done, daemon=True).start()
+        self.superview().audio_controller.playURL_forButton_(url, sender)
 
     def drawRect_(self, rect):
-        """Draw background."""
+        """Draw background and the meta line."""
         bounds = self.bounds()
         bg_path = NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(bounds, 10, 10)
         NSColor.controlBackgroundColor().setFill()
         bg_path.fill()
 
+        if self._meta_attr is not None:
+            self._meta_attr.drawAtPoint_((16, 74))
+
 
 class HistoryContentView(NSView):
     """Scrollable content view containing all entries."""
@@ -411,69 +547,165 @@ class HistoryContentView(NSView):
     def initWithFrame_(self, frame):
         self = objc.super(HistoryContentView, self).initWithFrame_(frame)
         if self:
-            self.entry_views = []
             self.all_entries = []
             self.filtered_entries = []
             self.search_query = ""
+            self._lower_texts = []
+            self._last_query = ""
+            self._last_filtered_indices = []
+            self._meta_cache = {}
+            # Virtualized rows: row index -> bound EntryView, plus a pool
+            # of unbound rows ready for reuse
+            self._active_views = {}
+            self._view_pool = []
+            self._observing_clip = False
+            self.audio_controller = AudioController.alloc().init()
+            self._resize_pending = False
         return self
 
     def isFlipped(self):
         """Use flipped coordinates (origin at top-left)."""
         return True
 
+    def viewDidMoveToSuperview(self):
+        """Watch the clip view so scrolling rebinds rows."""
+        clip = self.superview()
+        if clip is not None and not self._observing_clip:
+            clip.setPostsBoundsChangedNotifications_(True)
+            NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+                self,
+                "clipBoundsChanged:",
+                NSViewBoundsDidChangeNotification,
+                clip,
+            )
+            self._observing_clip = True
+
+    def clipBoundsChanged_(self, notification):
+        """Scroll position changed - rebind rows to the visible range."""
+        self._update_visible_rows()
+
     def loadEntries_(self, entries):
         """Load and display entries."""
+        self.loadPreparedEntries_(prepare_entries(entries))
+
+    def loadPreparedEntries_(self, prepared):
+        """Install entries whose caches were built by prepare_entries."""
+        entries = prepared["entries"]
         self.all_entries = entries
         self.filtered_entries = entries
+        # Prebuilt caches: lowered texts for filtering, per-entry meta
+        # strings for row binds (filtering never changes either)
+        self._lower_texts = prepared["lower_texts"]
+        self._meta_cache = prepared["meta"]
+        self._last_query = ""
+        self._last_filtered_indices = list(range(len(entries)))
         self._rebuild_views()
 
     def filterWithQuery_(self, query):
         """Filter entries by search query."""
         self.search_query = query.strip()
         query_lower = self.search_query.lower()
+
         if not query_lower:
+            indices = list(range(len(self.all_entries)))
             self.filtered_entries = self.all_entries
         else:
-            self.filtered_entries = [
-                e for e in self.all_entries
-                if query_lower in e.text.lower()
-            ]
-        self._rebuild_views()
+            # Extending the previous query can only narrow its result set,
+            # so rescan the previous matches instead of the whole history
+            if self._last_query and query_lower.startswith(self._last_query):
+                candidates = self._last_filtered_indices
+            else:
+                candidates = range(len(self.all_entries))
+            lower = self._lower_texts
+            indices = [i for i in candidates if query_lower in lower[i]]
+            self.filtered_entries = [self.all_entries[i] for i in indices]
+
+        unchanged = indices == self._last_filtered_indices
+        self._last_query = query_lower
+        self._last_filtered_indices = indices
+
+        if unchanged:
+            # Same rows in the same places - skip the geometry pass and
+            # just rebind the visible rows so highlighting tracks the query
+            for row in list(self._active_views):
+                self._recycle_row(row)
+            self._update_visible_rows()
+        else:
+            self._rebuild_views()
 
     def _rebuild_views(self):
-        """Rebuild entry views."""
-        # Remove old views
-        for view in self.entry_views:
-            view.removeFromSuperview()
-        self.entry_views = []
+        """Recompute content size and rebind rows after a data change."""
+        # Unbind everything; _update_visible_rows re-binds what's on screen
+        for row in list(self._active_views):
+            self._recycle_row(row)
 
-        # Calculate dimensions
         width = self.bounds().size.width
-        entry_height = 100
-        spacing = 12
-        padding_top = 8
-
-        # Create entry views (top to bottom since flipped)
-        y = padding_top
-        for entry in self.filtered_entries:
-            entry_view = EntryView.alloc().initWithEntry_width_searchQuery_(
-                entry, width - 16, self.search_query
-            )
-            entry_view.setFrameOrigin_((8, y))
-            self.addSubview_(entry_view)
-            self.entry_views.append(entry_view)
-            y += entry_height + spacing
-
-        # Update content size
+        n = len(self.filtered_entries)
+        content_height = ENTRY_PADDING * 2 + n * (ENTRY_HEIGHT + ENTRY_SPACING)
         total_height = max(
-            y + padding_top,
+            content_height,
             self.superview().bounds().size.height if self.superview() else 400
         )
-        self.setFrameSize_((width, total_height))
+        # Resizing the document view invalidates the scroller; skip the
+        # AppKit call when refiltering didn't change the content size
+        if self.frame().size.height != total_height:
+            self.setFrameSize_((width, total_height))
+
+        self._update_visible_rows()
+
+    def _update_visible_rows(self):
+        """Bind pooled EntryViews to the rows intersecting the visible rect."""
+        n = len(self.filtered_entries)
+        visible = self.visibleRect()
+        stride = ENTRY_HEIGHT + ENTRY_SPACING
+
+        if n == 0 or visible.size.height <= 0:
+            first, last = 0, -1
+        else:
+            first = max(0, int((visible.origin.y - ENTRY_PADDING) // stride))
+            last = min(
+                n - 1,
+                int((visible.origin.y + visible.size.height - ENTRY_PADDING) // stride),
+            )
+
+        # Recycle rows that scrolled out of range
+        for row in [r for r in self._active_views if r < first or r > last]:
+            self._recycle_row(row)
+
+        # Bind rows that scrolled into range
+        width = self.bounds().size.width
+        for row in range(first, last + 1):
+            if row in self._active_views:
+                continue
+            if self._view_pool:
+                view = self._view_pool.pop()
+            else:
+                view = EntryView.alloc().initWithWidth_(width - 16)
+                self.addSubview_(view)
+            view.setFrame_(NSMakeRect(8, ENTRY_PADDING + row * stride, width - 16, ENTRY_HEIGHT))
+            entry = self.filtered_entries[row]
+            view.configureWithEntry_searchQuery_meta_(
+                entry, self.search_query, self._meta_cache.get(id(entry))
+            )
+            view.setHidden_(False)
+            self._active_views[row] = view
+
+    def _recycle_row(self, row):
+        """Return a row's view to the pool (hidden, still in the hierarchy)."""
+        view = self._active_views.pop(row)
+        view.setHidden_(True)
+        self._view_pool.append(view)
 
     def resizeWithOldSuperviewSize_(self, oldSize):
-        """Handle resize."""
+        """Handle resize (coalesced - live resize fires this per tick)."""
         objc.super(HistoryContentView, self).resizeWithOldSuperviewSize_(oldSize)
+        if not self._resize_pending:
+            self._resize_pending = True
+            self.performSelector_withObject_afterDelay_("doResize:", None, 0.0)
+
+    def doResize_(self, _):
+        """Rebuild once the runloop has drained the resize burst."""
+        self._resize_pending = False
         self._rebuild_views()
 
 
@@ -529,6 +761,15 @@ class HistoryViewerApp(NSObject):
         history = get_history()
         entries = history.get_all()
 
+        # Build the content view's caches off-main so the pure-Python
+        # pre-work overlaps with AppKit chrome construction below
+        def prepare():
+            prepared = prepare_entries(entries)
+            self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                "installPreparedEntries:", prepared, False
+            )
+        threading.Thread(target=prepare, daemon=True).start()
+
         # Main container view
         container = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, win_width, win_height))
         container.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)
@@ -582,16 +823,26 @@ class HistoryViewerApp(NSObject):
 
         self.window.setContentView_(container)
 
-        # Load entries into content view
-        self.content_view.loadEntries_(entries)
-        self._update_count()
-
-        # Show window
+        # Show window; entries arrive via installPreparedEntries_ once the
+        # background prepare finishes
         self.window.makeKeyAndOrderFront_(None)
 
+    def installPreparedEntries_(self, prepared):
+        """Main-thread landing point for the background prepare."""
+        self.content_view.loadPreparedEntries_(prepared)
+        self._update_count()
+
     def searchChanged_(self, sender):
-        """Handle search field changes."""
-        query = sender.stringValue()
+        """Handle search field changes (debounced)."""
+        # Coalesce bursts of keystrokes into one filter pass: cancel the
+        # pending run and reschedule on the runloop - no threads involved
+        NSObject.cancelPreviousPerformRequestsWithTarget_(self)
+        self.performSelector_withObject_afterDelay_(
+            "doSearch:", sender.stringValue(), 0.08
+        )
+
+    def doSearch_(self, query):
+        """Run the actual filter once the debounce delay elapses."""
         self.content_view.filterWithQuery_(query)
         self._update_count()
 
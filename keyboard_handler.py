@@ -38,6 +38,39 @@ FLAG_OPT = Quartz.kCGEventFlagMaskAlternate
 FLAG_CTRL = Quartz.kCGEventFlagMaskControl
 FLAG_RIGHT_CMD = 0x10  # Right Command key flag (in device-dependent bits)
 
+# Bits for the held-key bitmask (one bit per key the presets care about)
+BIT_FN = 1
+BIT_CMD = 2
+BIT_RIGHT_CMD = 4
+BIT_SHIFT = 8
+BIT_OPT = 16
+BIT_CTRL = 32
+BIT_SPACE = 64
+
+def _events_for_mask(required_mask: int) -> int:
+    """Event-tap mask for a preset.
+
+    Only Space-based presets need keyDown/keyUp; modifier-only presets
+    listen for flagsChanged alone, so ordinary typing never enters Python.
+    """
+    events = Quartz.CGEventMaskBit(Quartz.kCGEventFlagsChanged)
+    if required_mask & BIT_SPACE:
+        events |= (
+            Quartz.CGEventMaskBit(Quartz.kCGEventKeyDown) |
+            Quartz.CGEventMaskBit(Quartz.kCGEventKeyUp)
+        )
+    return events
+
+
+# Required bitmask per hotkey preset - the hotkey check is a single mask compare
+HOTKEY_MASKS = {
+    "fn": BIT_FN,
+    "right_cmd": BIT_RIGHT_CMD,
+    "cmd_shift_space": BIT_CMD | BIT_SHIFT | BIT_SPACE,
+    "opt_space": BIT_OPT | BIT_SPACE,
+    "ctrl_space": BIT_CTRL | BIT_SPACE,
+}
+
 
 class HotkeyHandler:
     """Handles configurable hotkeys using Quartz event taps."""
@@ -50,6 +83,7 @@ class HotkeyHandler:
         self._tap = None
         self._loop_source = None
         self._thread = None
+        self._cf_runloop = None
 
         # Create dispatcher for main thread callbacks
         self._dispatcher = CallbackDispatcher.alloc().initWithCallbacks_({
@@ -57,96 +91,136 @@ class HotkeyHandler:
             'on_release': on_release,
         })
 
-        # Track modifier states
-        self._fn_held = False
-        self._cmd_held = False
-        self._right_cmd_held = False
-        self._shift_held = False
-        self._opt_held = False
-        self._ctrl_held = False
-        self._space_held = False
-
-    def _check_hotkey(self) -> bool:
-        """Check if current hotkey combination is active."""
-        hotkey = config.get_current_hotkey()
-
-        if hotkey == "fn":
-            return self._fn_held
-
-        elif hotkey == "right_cmd":
-            return self._right_cmd_held
-
-        elif hotkey == "cmd_shift_space":
-            return self._cmd_held and self._shift_held and self._space_held
+        # Held-key state as a single bitmask (see BIT_* constants)
+        self._held_mask = 0
+        # Required mask specialized to the active hotkey; recomputed only
+        # when the hotkey changes, not per event
+        self._required_mask = HOTKEY_MASKS.get(config.get_current_hotkey(), 0)
+        self._handler = self._handle_event
+        self._select_handler(config.get_current_hotkey())
+
+    def set_hotkey(self, hotkey_id: str):
+        """Re-specialize the handler for a new hotkey preset."""
+        old_events = _events_for_mask(self._required_mask)
+        self._required_mask = HOTKEY_MASKS.get(hotkey_id, 0)
+        self._held_mask = 0
+        self._select_handler(hotkey_id)
+
+        # The tap's event mask depends on whether Space is involved;
+        # re-create the tap when that requirement changes
+        if self._running and _events_for_mask(self._required_mask) != old_events:
+            self.stop()
+            if self._thread:
+                self._thread.join(timeout=1.0)
+            self.start()
+
+    def _select_handler(self, hotkey_id: str):
+        """Bind the per-event handler specialized for the preset.
+
+        Single-key presets get a dedicated handler that tests one flag
+        instead of rebuilding the full held-key mask on every event.
+        """
+        if hotkey_id == "fn":
+            self._handler = self._handle_fn_event
+        elif hotkey_id == "right_cmd":
+            self._handler = self._handle_right_cmd_event
+        else:
+            self._handler = self._handle_event
+
+    def _set_active(self, active: bool):
+        """Fire the press/release callbacks on active-state transitions."""
+        if active and not self.is_active:
+            self.is_active = True
+            # Dispatch to main thread
+            self._dispatcher.performSelectorOnMainThread_withObject_waitUntilDone_(
+                "dispatchPress:", None, False
+            )
+        elif not active and self.is_active:
+            self.is_active = False
+            # Dispatch to main thread
+            self._dispatcher.performSelectorOnMainThread_withObject_waitUntilDone_(
+                "dispatchRelease:", None, False
+            )
 
-        elif hotkey == "opt_space":
-            return self._opt_held and self._space_held
+    def _handle_fn_event(self, proxy, event_type, event, refcon):
+        """Specialized handler for the Fn-only preset: one flag test."""
+        if event_type == Quartz.kCGEventFlagsChanged:
+            self._set_active(bool(Quartz.CGEventGetFlags(event) & FLAG_FN))
+        return event
 
-        elif hotkey == "ctrl_space":
-            return self._ctrl_held and self._space_held
+    def _handle_right_cmd_event(self, proxy, event_type, event, refcon):
+        """Specialized handler for the right-Command preset."""
+        if event_type == Quartz.kCGEventFlagsChanged:
+            # Right Command is keycode 54 (left is 55)
+            keycode = Quartz.CGEventGetIntegerValueField(
+                event, Quartz.kCGKeyboardEventKeycode
+            )
+            if keycode == 54:
+                self._set_active(
+                    bool(Quartz.CGEventGetFlags(event) & FLAG_CMD)
+                )
+        return event
 
-        return False
+    def _check_hotkey(self) -> bool:
+        """Check if current hotkey combination is active."""
+        required = self._required_mask
+        return required != 0 and (self._held_mask & required) == required
 
     def _handle_event(self, proxy, event_type, event, refcon):
         """Handle keyboard events."""
         if event_type == Quartz.kCGEventFlagsChanged:
-            # Modifier key changed
+            # Modifier key changed - rebuild the modifier bits from the flags
             flags = Quartz.CGEventGetFlags(event)
             keycode = Quartz.CGEventGetIntegerValueField(
                 event, Quartz.kCGKeyboardEventKeycode
             )
 
-            # Track Fn key (flag-based, no specific keycode)
-            self._fn_held = bool(flags & FLAG_FN)
-
-            # Track Command keys
-            # Right Command is keycode 54, Left Command is 55
-            if keycode == 54:  # Right Command
-                self._right_cmd_held = bool(flags & FLAG_CMD)
-            elif keycode == 55:  # Left Command
-                pass  # We don't track left cmd separately
-
-            self._cmd_held = bool(flags & FLAG_CMD)
-            self._shift_held = bool(flags & FLAG_SHIFT)
-            self._opt_held = bool(flags & FLAG_OPT)
-            self._ctrl_held = bool(flags & FLAG_CTRL)
+            # Preserve the non-modifier bits (Space) and right-cmd tracking
+            mask = self._held_mask & (BIT_SPACE | BIT_RIGHT_CMD)
+            if flags & FLAG_FN:
+                mask |= BIT_FN
+            if flags & FLAG_CMD:
+                mask |= BIT_CMD
+            if flags & FLAG_SHIFT:
+                mask |= BIT_SHIFT
+            if flags & FLAG_OPT:
+                mask |= BIT_OPT
+            if flags & FLAG_CTRL:
+                mask |= BIT_CTRL
+
+            # Right Command is keycode 54 (left is 55); it only changes state
+            # on its own flagsChanged event
+            if keycode == 54:
+                if flags & FLAG_CMD:
+                    mask |= BIT_RIGHT_CMD
+                else:
+                    mask &= ~BIT_RIGHT_CMD
+
+            self._held_mask = mask
 
         elif event_type == Quartz.kCGEventKeyDown:
             keycode = Quartz.CGEventGetIntegerValueField(
                 event, Quartz.kCGKeyboardEventKeycode
             )
             if keycode == 49:  # Space
-                self._space_held = True
+                self._held_mask |= BIT_SPACE
 
         elif event_type == Quartz.kCGEventKeyUp:
             keycode = Quartz.CGEventGetIntegerValueField(
                 event, Quartz.kCGKeyboardEventKeycode
             )
             if keycode == 49:  # Space
-                self._space_held = False
+                self._held_mask &= ~BIT_SPACE
 
         # Check hotkey state
-        hotkey_active = self._check_hotkey()
-
-        if hotkey_active and not self.is_active:
-            self.is_active = True
-            # Dispatch to main thread
-            self._dispatcher.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "dispatchPress:", None, False
-            )
-        elif not hotkey_active and self.is_active:
-            self.is_active = False
-            # Dispatch to main thread
-            self._dispatcher.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "dispatchRelease:", None, False
-            )
+        self._set_active(self._check_hotkey())
 
         return event
 
     def _event_callback(self, proxy, event_type, event, refcon):
         """C callback wrapper."""
         try:
-            return self._handle_event(proxy, event_type, event, refcon)
+            return self._handler(proxy, event_type, event, refcon)
         except Exception as e:
             print(f"Event callback error: {e}")
             return event
@@ -159,12 +233,8 @@ class HotkeyHandler:
         self._running = True
 
         def run_loop():
-            # Create event tap
-            events = (
-                Quartz.CGEventMaskBit(Quartz.kCGEventFlagsChanged) |
-                Quartz.CGEventMaskBit(Quartz.kCGEventKeyDown) |
-                Quartz.CGEventMaskBit(Quartz.kCGEventKeyUp)
-            )
+            # Create event tap listening only for what the preset needs
+            events = _events_for_mask(self._required_mask)
 
             self._tap = Quartz.CGEventTapCreate(
                 Quartz.kCGSessionEventTap,
@@ -180,12 +250,13 @@ class HotkeyHandler:
                 self._running = False
                 return
 
-            # Add to run loop
+            # Add to run loop; keep a handle so stop() can halt it
+            self._cf_runloop = Quartz.CFRunLoopGetCurrent()
             self._loop_source = Quartz.CFMachPortCreateRunLoopSource(
                 None, self._tap, 0
             )
             Quartz.CFRunLoopAddSource(
-                Quartz.CFRunLoopGetCurrent(),
+                self._cf_runloop,
                 self._loop_source,
                 Quartz.kCFRunLoopCommonModes,
             )
@@ -193,11 +264,8 @@ class HotkeyHandler:
 
             print(f"Keyboard listener started (hotkey: {config.get_current_hotkey()})")
 
-            # Run the loop
-            while self._running:
-                Quartz.CFRunLoopRunInMode(
-                    Quartz.kCFRunLoopDefaultMode, 0.1, False
-                )
+            # Block until stop() calls CFRunLoopStop - no idle wakeups
+            Quartz.CFRunLoopRun()
 
         self._thread = threading.Thread(target=run_loop, daemon=True)
         self._thread.start()
@@ -207,6 +275,9 @@ class HotkeyHandler:
         self._running = False
         if self._tap:
             Quartz.CGEventTapEnable(self._tap, False)
+        if self._cf_runloop is not None:
+            Quartz.CFRunLoopStop(self._cf_runloop)
+            self._cf_runloop = None
 
 
 def get_hotkey_display() -> str:
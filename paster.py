@@ -23,11 +23,16 @@ class Paster:
         """Paste by copying to clipboard and simulating Cmd+V with Quartz."""
         # Copy to clipboard using native API
         pasteboard = NSPasteboard.generalPasteboard()
+        old_count = pasteboard.changeCount()
         pasteboard.clearContents()
         pasteboard.setString_forType_(text, NSPasteboardTypeString)
 
-        # Small delay to ensure clipboard is ready
-        time.sleep(0.1)
+        # Wait only until the pasteboard actually registers the new
+        # contents (changeCount advances), capped at 20ms - replaces a
+        # fixed 100ms sleep that dominated paste latency
+        deadline = time.monotonic() + 0.02
+        while pasteboard.changeCount() <= old_count and time.monotonic() < deadline:
+            time.sleep(0.0001)
 
         # Simulate Cmd+V using Quartz (more reliable than pynput)
         # Key code 9 = 'v'
@@ -49,22 +54,20 @@ class Paster:
 
     def _paste_via_typing(self, text: str):
         """Paste by simulating keystrokes (slower but more compatible)."""
-        for char in text:
-            # Get unicode value
-            unicode_char = ord(char)
+        # One down/up event pair reused for every character - only the
+        # unicode payload changes per iteration, so the per-char CGEvent
+        # creation syscalls are paid once. Events posted to the HID tap
+        # are delivered in order, so no inter-character delay is needed.
+        key_down = Quartz.CGEventCreateKeyboardEvent(None, 0, True)
+        key_up = Quartz.CGEventCreateKeyboardEvent(None, 0, False)
 
-            # Create key events for the character
-            key_down = Quartz.CGEventCreateKeyboardEvent(None, 0, True)
+        for char in text:
             Quartz.CGEventKeyboardSetUnicodeString(key_down, 1, char)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, key_down)
 
-            key_up = Quartz.CGEventCreateKeyboardEvent(None, 0, False)
             Quartz.CGEventKeyboardSetUnicodeString(key_up, 1, char)
-
-            Quartz.CGEventPost(Quartz.kCGHIDEventTap, key_down)
             Quartz.CGEventPost(Quartz.kCGHIDEventTap, key_up)
 
-            time.sleep(0.01)  # Small delay between characters
-
 
 # Singleton instance
 _paster = None
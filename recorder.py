@@ -3,6 +3,7 @@
 import numpy as np
 import sounddevice as sd
 from scipy.io import wavfile
+from concurrent.futures import ThreadPoolExecutor
 from threading import Event
 from typing import Optional
 from pathlib import Path
@@ -21,26 +22,66 @@ class AudioRecorder:
         self.sample_rate = config.SAMPLE_RATE
         self.channels = config.CHANNELS
         self.recording = False
-        self.audio_data: list[np.ndarray] = []
         self.stop_event = Event()
         self.last_saved_file: Optional[Path] = None
         self.on_audio_chunk = None  # Callback for live audio data
         self.latest_chunk: Optional[np.ndarray] = None
+        self._samples_seen = 0
+        self._last_voice_sample = 0
+        # Preallocated capture buffer: the callback writes at a cursor
+        # instead of appending list chunks, so memory stays bounded and
+        # stop() is a slice rather than an O(N) concatenate
+        self._buf = np.empty(
+            config.MAX_RECORD_SECONDS * self.sample_rate, dtype=np.float32
+        )
+        self._write = 0
+        self._overflowed = False
+        # Per-blocksize chunk buffers reused across callbacks; the stream
+        # delivers a fixed blocksize, so this holds one or two entries
+        self._chunk_pool: dict = {}
+        # Single worker so WAV writes happen off the stop() path but
+        # still land in submission order
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
 
     def start(self, on_audio_chunk=None):
         """Start recording audio. Optional callback receives live audio chunks."""
         self.recording = True
-        self.audio_data = []
         self.stop_event.clear()
         self.on_audio_chunk = on_audio_chunk
+        self._samples_seen = 0
+        self._last_voice_sample = 0
+        self._write = 0
+        self._overflowed = False
 
         def callback(indata, frames, time, status):
             if status:
                 print(f"Recording status: {status}")
             if self.recording:
-                chunk = indata.copy().flatten()
-                self.audio_data.append(indata.copy())
+                # Copy into a pooled buffer instead of allocating per
+                # callback; consumers (buffer write below, the waveform
+                # indicator) all copy synchronously, so the buffer is
+                # free again by the next callback
+                chunk = self._chunk_pool.get(frames)
+                if chunk is None:
+                    chunk = np.empty(frames, dtype=np.float32)
+                    self._chunk_pool[frames] = chunk
+                np.copyto(chunk, indata.ravel())
                 self.latest_chunk = chunk
+                # Write into the preallocated buffer; frames past the cap
+                # are dropped rather than growing memory unboundedly
+                w = self._write
+                n = min(len(chunk), len(self._buf) - w)
+                if n:
+                    self._buf[w:w + n] = chunk[:n]
+                    self._write = w + n
+                elif not self._overflowed:
+                    self._overflowed = True
+                    print("Recording buffer full, dropping further audio")
+                # Track the last chunk with voice energy so trailing silence
+                # can be trimmed at stop
+                self._samples_seen += len(chunk)
+                if np.sqrt(np.mean(chunk * chunk)) >= config.SILENCE_RMS_THRESHOLD:
+                    self._last_voice_sample = self._samples_seen
                 # Call the live audio callback if set
                 if self.on_audio_chunk:
                     try:
@@ -67,30 +108,46 @@ class AudioRecorder:
         self.stream.close()
         print("Recording stopped.")
 
-        if not self.audio_data:
+        if self._write == 0:
             return None
 
-        # Concatenate all chunks into single array
-        audio = np.concatenate(self.audio_data, axis=0)
-        # Flatten to 1D if needed
-        if audio.ndim > 1:
-            audio = audio.flatten()
+        # Copy out of the capture buffer so the next recording can start
+        # while this audio is still being transcribed
+        audio = self._buf[:self._write].copy()
+
+        # Trim trailing silence (hotkey held past end of speech) - Whisper's
+        # encoder cost scales with input length. If no chunk ever cleared
+        # the threshold (whispered or very quiet speech), don't trim at
+        # all and let the transcriber's peak gate decide what to do.
+        if self._last_voice_sample > 0:
+            keep = self._last_voice_sample + int(config.SILENCE_TAIL_SECONDS * self.sample_rate)
+            if keep < len(audio):
+                audio = audio[:keep]
 
         duration = len(audio) / self.sample_rate
         max_amp = np.abs(audio).max()
         print(f"Recorded {duration:.2f} seconds of audio (max amplitude: {max_amp:.4f})")
 
-        # Save recording to disk
+        # Save recording to disk in the background so the caller can hand
+        # the audio to the transcriber without waiting on the write; the
+        # array is only read downstream, so sharing it is safe
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filepath = RECORDINGS_DIR / f"recording_{timestamp}.wav"
-        # Convert float32 [-1, 1] to int16 for WAV
-        audio_int16 = (audio * 32767).astype(np.int16)
-        wavfile.write(filepath, self.sample_rate, audio_int16)
         self.last_saved_file = filepath
-        print(f"Saved recording to: {filepath}")
+        self._save_executor.submit(self._write_wav, audio, filepath)
 
         return audio
 
+    def _write_wav(self, audio: np.ndarray, filepath: Path):
+        """Write a recording to disk (runs on the save executor)."""
+        try:
+            # scipy writes float32 arrays as IEEE-float WAV, which Core
+            # Audio plays fine - skips the scale-and-cast pass
+            wavfile.write(filepath, self.sample_rate, audio)
+            print(f"Saved recording to: {filepath}")
+        except Exception as e:
+            print(f"Error saving recording: {e}")
+
     def is_recording(self) -> bool:
         """Check if currently recording."""
         return self.recording
@@ -24,13 +24,11 @@ OPTIONS = {
     },
     'packages': [
         'rumps',
-        'pynput',
         'sounddevice',
         'numpy',
         'scipy',
         'mlx',
         'mlx_whisper',
-        'pyperclip',
         'huggingface_hub',
         'tokenizers',
         'tiktoken',
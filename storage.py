@@ -1,15 +1,21 @@
 """Storage module for transcription history."""
 
 import json
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 # Store history in user's Application Support
 APP_SUPPORT_DIR = Path.home() / "Library" / "Application Support" / "VoiceDictation"
 APP_SUPPORT_DIR.mkdir(parents=True, exist_ok=True)
-HISTORY_FILE = APP_SUPPORT_DIR / "history.json"
+HISTORY_FILE = APP_SUPPORT_DIR / "history.jsonl"
+LEGACY_HISTORY_FILE = APP_SUPPORT_DIR / "history.json"
+
+# Keep only this many entries (most recent first)
+MAX_ENTRIES = 100
 
 
 @dataclass
@@ -22,7 +28,15 @@ class TranscriptionEntry:
     audio_file: Optional[str] = None
 
     def to_dict(self):
-        return asdict(self)
+        # Explicit literal instead of dataclasses.asdict, which walks the
+        # fields reflectively and deep-copies every value
+        return {
+            "id": self.id,
+            "text": self.text,
+            "timestamp": self.timestamp,
+            "duration_seconds": self.duration_seconds,
+            "audio_file": self.audio_file,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "TranscriptionEntry":
@@ -33,58 +47,88 @@ class TranscriptionHistory:
     """Manages transcription history storage."""
 
     def __init__(self):
-        self.entries: list[TranscriptionEntry] = []
+        # Bounded deque: appendleft is O(1) and the maxlen evicts the
+        # oldest entry automatically
+        self.entries: deque[TranscriptionEntry] = deque(maxlen=MAX_ENTRIES)
+        self._adds_since_compact = 0
         self._load()
 
     def _load(self):
-        """Load history from disk."""
-        if HISTORY_FILE.exists():
-            try:
+        """Load history from disk (migrating the old JSON format if found)."""
+        try:
+            if HISTORY_FILE.exists():
                 with open(HISTORY_FILE, "r") as f:
+                    # Stream line by line, retaining only the newest; the
+                    # whole file is never materialized even if the log has
+                    # grown well past the cap between compactions
+                    lines = deque(f, maxlen=MAX_ENTRIES)
+                # Lines are in append order (oldest first); keep the newest
+                for line in reversed(lines):
+                    self.entries.append(TranscriptionEntry.from_dict(json.loads(line)))
+            elif LEGACY_HISTORY_FILE.exists():
+                with open(LEGACY_HISTORY_FILE, "r") as f:
                     data = json.load(f)
-                    self.entries = [TranscriptionEntry.from_dict(e) for e in data]
-            except Exception as e:
-                print(f"Error loading history: {e}")
-                self.entries = []
+                self.entries = deque(
+                    (TranscriptionEntry.from_dict(e) for e in data[:MAX_ENTRIES]),
+                    maxlen=MAX_ENTRIES,
+                )
+                self._compact()
+        except Exception as e:
+            print(f"Error loading history: {e}")
+            self.entries = deque(maxlen=MAX_ENTRIES)
 
-    def _save(self):
-        """Save history to disk."""
+    def _append_entry(self, entry: TranscriptionEntry):
+        """Append a single entry line to the history file."""
+        try:
+            with open(HISTORY_FILE, "a") as f:
+                f.write(json.dumps(entry.to_dict()) + "\n")
+        except Exception as e:
+            print(f"Error saving history: {e}")
+
+    def _compact(self):
+        """Rewrite the file down to just the retained entries."""
         try:
             with open(HISTORY_FILE, "w") as f:
-                json.dump([e.to_dict() for e in self.entries], f, indent=2)
+                # Oldest first, so subsequent appends keep the file ordered
+                for e in reversed(self.entries):
+                    f.write(json.dumps(e.to_dict()) + "\n")
         except Exception as e:
             print(f"Error saving history: {e}")
 
     def add(self, text: str, duration_seconds: float, audio_file: Optional[str] = None) -> TranscriptionEntry:
         """Add a new transcription entry."""
+        now = datetime.now()
         entry = TranscriptionEntry(
-            id=datetime.now().strftime("%Y%m%d_%H%M%S_%f"),
+            id=now.strftime("%Y%m%d_%H%M%S_%f"),
             text=text,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now.isoformat(),
             duration_seconds=duration_seconds,
             audio_file=audio_file,
         )
-        self.entries.insert(0, entry)  # Most recent first
-
-        # Keep only last 100 entries
-        if len(self.entries) > 100:
-            self.entries = self.entries[:100]
-
-        self._save()
+        self.entries.appendleft(entry)  # Most recent first; maxlen trims
+
+        # Appending one line per add keeps the write O(1); a periodic
+        # compaction stops the file from growing past the retention cap
+        self._adds_since_compact += 1
+        if self._adds_since_compact >= MAX_ENTRIES:
+            self._adds_since_compact = 0
+            self._compact()
+        else:
+            self._append_entry(entry)
         return entry
 
     def get_all(self) -> list[TranscriptionEntry]:
         """Get all entries (most recent first)."""
-        return self.entries
+        return list(self.entries)
 
     def get_recent(self, count: int = 10) -> list[TranscriptionEntry]:
         """Get most recent entries."""
-        return self.entries[:count]
+        return list(islice(self.entries, count))
 
     def clear(self):
         """Clear all history."""
-        self.entries = []
-        self._save()
+        self.entries.clear()
+        self._compact()
 
 
 # Singleton instance
@@ -1,7 +1,6 @@
 """Transcription module using mlx-whisper for Apple Silicon."""
 
 import numpy as np
-import mlx_whisper
 from typing import Optional
 import config
 
@@ -14,37 +13,53 @@ class Transcriber:
         print("Using mlx-whisper (Apple Silicon optimized)")
 
     def load_model(self):
-        """Pre-warm the model by running a dummy transcription."""
+        """Pre-warm the model by loading its weights."""
         if self.model_loaded:
             return
 
+        # Imported lazily so app startup doesn't block on the heavy MLX
+        # import; the preload background thread pays it instead
+        import mlx.core as mx
+        from mlx_whisper.transcribe import ModelHolder
+
         print(f"Loading model: {config.MODEL_ID}...")
         print("This may take a moment on first run...")
 
-        # Warm up by transcribing silence
-        dummy_audio = np.zeros(16000, dtype=np.float32)  # 1 second of silence
-        mlx_whisper.transcribe(
-            dummy_audio,
-            path_or_hf_repo=config.MODEL_ID,
-        )
+        # Populate the model cache transcribe() reads from - weight load
+        # only, no encoder/decoder run over dummy audio
+        ModelHolder.get_model(config.MODEL_ID, mx.float16)
 
         self.model_loaded = True
         print("Model loaded successfully!")
 
     def transcribe(self, audio: np.ndarray) -> Optional[str]:
         """Transcribe audio array to text."""
-        if audio is None or len(audio) == 0:
+        import mlx_whisper
+
+        # Too short to hold speech (accidental hotkey tap) - skip the
+        # whole MLX run, not just the empty-array case
+        if audio is None or len(audio) < config.MIN_AUDIO_SAMPLES:
             return None
 
         # Ensure audio is float32
         if audio.dtype != np.float32:
             audio = audio.astype(np.float32)
 
-        # Normalize audio if needed
-        if np.abs(audio).max() > 1.0:
-            audio = audio / np.abs(audio).max()
+        # One pass over the audio for the peak; the normalize branch and
+        # the log line below reuse it instead of rescanning
+        peak = float(np.abs(audio).max())
+
+        # Silent or near-silent recording (stray click, dead mic): skip
+        # the whole encoder run rather than transcribing nothing
+        if peak < config.VAD_THRESHOLD:
+            print("Audio is silent, skipping")
+            return None
+
+        if peak > 1.0:
+            audio = audio / peak
+            peak = 1.0
 
-        print(f"Transcribing... (audio length: {len(audio)}, max: {np.abs(audio).max():.4f})")
+        print(f"Transcribing... (audio length: {len(audio)}, max: {peak:.4f})")
 
         # Run transcription with mlx-whisper
         result = mlx_whisper.transcribe(
@@ -83,7 +98,7 @@ if __name__ == "__main__":
     sample_rate = config.SAMPLE_RATE
     audio = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype=np.float32)
     sd.wait()
-    audio = audio.flatten()
+    audio = audio.reshape(-1)  # view, not the copy flatten() makes
 
     print(f"Recorded audio shape: {audio.shape}")
     print(f"Max amplitude: {np.abs(audio).max():.4f}")